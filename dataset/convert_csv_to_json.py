@@ -2,43 +2,81 @@
 """Convert the CSV dataset to JSON format for evaluation."""
 
 import csv
-import json
+import os
 
+import orjson
 
-def convert_csv_to_json(csv_path="updated_dataset.csv", json_path="Q1-dataset.json"):
-    """Convert CSV dataset to JSON format."""
-    dataset = []
 
+def iter_entries(csv_path):
+    """Yield JSON entries for the Type 1 queries in the CSV dataset."""
     with open(csv_path, encoding="utf-8") as csvfile:
-        reader = csv.DictReader(csvfile)
+        reader = csv.reader(csvfile)
+
+        # Resolve the column positions once instead of building a dict per row
+        header = next(reader)
+        query_col = header.index("Original Query ")
+        target_col = header.index("Target Text")
+        source_col = header.index("Source")
+        type_col = header.index("Query Type")
+        min_length = max(query_col, target_col, type_col) + 1
 
         for row in reader:
-            # Skip empty rows or rows without proper data
-            if not row.get("Original Query ") or not row.get("Target Text"):
+            # Skip blank lines and ragged rows missing a required column; like
+            # csv.DictReader, a missing Source is treated as empty
+            if len(row) < min_length:
+                continue
+
+            # Only include Type 1 queries; checked first since most rows are
+            # skipped here
+            if row[type_col] != "1":
                 continue
 
-            # Only include Type 1 queries
-            if row.get("Query Type") != "1":
+            # Skip empty rows or rows without proper data
+            if not row[query_col] or not row[target_col]:
                 continue
 
             # Create the JSON entry
-            entry = {
-                "inputs": {"question": row["Original Query "].strip()},
+            source = row[source_col] if len(row) > source_col else ""
+            yield {
+                "inputs": {"question": row[query_col].strip()},
                 "outputs": {
-                    "answer": row["Target Text"].strip()
-                    + (f"\n\n{row['Source']}" if row.get("Source") else "")
+                    "answer": row[target_col].strip()
+                    + (f"\n\n{source}" if source else "")
                 },
             }
-            dataset.append(entry)
 
-    # Save to JSON file
-    with open(json_path, "w", encoding="utf-8") as jsonfile:
-        json.dump(dataset, jsonfile, ensure_ascii=False, indent=4)
 
-    print(f"Converted {len(dataset)} entries from CSV to JSON")
+def convert_csv_to_json(csv_path="updated_dataset.csv", json_path="Q1-dataset.json"):
+    """Convert CSV dataset to JSON format.
+
+    Entries are written to the JSON file as they are read from the CSV, so
+    memory use does not grow with the size of the dataset.
+    """
+    count = 0
+
+    # Stream the JSON array one entry at a time, formatted as a 2-space
+    # indented array; orjson writes UTF-8 directly, so Hebrew is not escaped.
+    # Write to a temporary file first so a failed conversion never leaves a
+    # truncated dataset behind.
+    tmp_path = f"{json_path}.tmp"
+    try:
+        with open(tmp_path, "wb", buffering=1 << 20) as jsonfile:
+            jsonfile.write(b"[")
+            for entry in iter_entries(csv_path):
+                jsonfile.write(b",\n" if count else b"\n")
+                text = orjson.dumps(entry, option=orjson.OPT_INDENT_2)
+                jsonfile.write(b"\n".join(b"  " + line for line in text.splitlines()))
+                count += 1
+            jsonfile.write(b"\n]" if count else b"]")
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, json_path)
+
+    print(f"Converted {count} entries from CSV to JSON")
     print(f"Saved to: {json_path}")
 
-    return dataset
+    return count
 
 
 if __name__ == "__main__":
@@ -1,8 +1,150 @@
 """Custom evaluators for Torah scholarship evaluation."""
 
+import functools
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
 from langsmith import traceable
-from openevals.llm import create_llm_as_judge
-from openevals.prompts import RAG_HELPFULNESS_PROMPT
+from langsmith.utils import ContextThreadPoolExecutor
+
+JUDGE_MODEL = "anthropic:claude-sonnet-4-20250514"
+
+# Persistent cache of judge verdicts; set JUDGE_CACHE=0 to always call the judge.
+# JUDGE_CACHE_STATS counts cached verdict lookups and the judge calls made for
+# those missing from both the in-memory and the disk cache.
+JUDGE_CACHE_DIR = Path(os.getenv("JUDGE_CACHE_DIR", ".judgecache"))
+JUDGE_CACHE_STATS = {"lookups": 0, "misses": 0}
+_JUDGE_CACHE_LOCK = threading.Lock()
+
+
+def _canonicalize(value):
+    """Collapse runs of whitespace in every string of a JSON-like value."""
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, dict):
+        return {key: _canonicalize(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_canonicalize(item) for item in value]
+    return value
+
+
+def cached_judge(prompt, feedback_key):
+    """Cache an evaluator's verdicts in memory and on disk.
+
+    Judges run at temperature 0, so verdicts are effectively deterministic
+    for a given prompt template, model and example, and re-running the same
+    dataset and target should not pay for the same judge call twice.
+    Verdicts are keyed on the example with whitespace collapsed, and looked
+    up in an in-process LRU cache and in one JSON file per SHA-256 key under
+    JUDGE_CACHE_DIR. The judge itself always grades the original, uncollapsed
+    example. ``prompt`` may also be a callable returning the template, for
+    templates that are only imported on first use.
+    """
+
+    def decorator(func):
+        # Dicts are not hashable, so the cache key and the original example are
+        # passed in JSON-encoded and the verdict is returned JSON-encoded as
+        # well, which also keeps callers from mutating the cached value. Only
+        # the key is canonicalized; the judge always sees the original example.
+        @functools.lru_cache(maxsize=4096)
+        def judge(payload: str, example_json: str) -> str:
+            key = hashlib.sha256(payload.encode()).hexdigest()
+            path = JUDGE_CACHE_DIR / f"{key}.json"
+
+            try:
+                result = path.read_text(encoding="utf-8")
+                json.loads(result)
+            except (FileNotFoundError, json.JSONDecodeError):
+                pass
+            else:
+                return result
+
+            with _JUDGE_CACHE_LOCK:
+                JUDGE_CACHE_STATS["misses"] += 1
+            example = json.loads(example_json)
+            result = json.dumps(
+                func(
+                    inputs=example["inputs"],
+                    outputs=example["outputs"],
+                    reference_outputs=example["reference_outputs"],
+                ),
+                default=str,
+            )
+
+            # Write to a temporary file first so concurrent readers never see
+            # a partially written entry
+            JUDGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_text(result, encoding="utf-8")
+            os.replace(tmp_path, path)
+            return result
+
+        @functools.wraps(func)
+        def wrapper(inputs: dict, outputs: dict, reference_outputs: dict):
+            if os.getenv("JUDGE_CACHE", "1") == "0":
+                return func(
+                    inputs=inputs, outputs=outputs, reference_outputs=reference_outputs
+                )
+
+            payload = json.dumps(
+                {
+                    "tmpl": prompt() if callable(prompt) else prompt,
+                    "m": JUDGE_MODEL,
+                    "k": feedback_key,
+                    "i": _canonicalize(inputs),
+                    "o": _canonicalize(outputs),
+                    "r": _canonicalize(reference_outputs),
+                },
+                sort_keys=True,
+                default=str,
+            )
+            example_json = json.dumps(
+                {
+                    "inputs": inputs,
+                    "outputs": outputs,
+                    "reference_outputs": reference_outputs,
+                },
+                default=str,
+            )
+            with _JUDGE_CACHE_LOCK:
+                JUDGE_CACHE_STATS["lookups"] += 1
+            return json.loads(judge(payload, example_json))
+
+        wrapper.cache_info = judge.cache_info
+        return wrapper
+
+    return decorator
+
+
+@functools.cache
+def _get_judge_model(model: str):
+    """Return the chat model shared by every judge using ``model``.
+
+    Created on first use rather than at import so that API keys loaded from
+    .env by the entrypoint are picked up, and shared so that all judges reuse
+    one client and its connection pool. LangChain and openevals are imported
+    on first use as well, since they are slow to import and not needed by
+    ``list``.
+    """
+    from langchain.chat_models import init_chat_model
+
+    return init_chat_model(model=model, temperature=0)
+
+
+@functools.cache
+def _get_judge(prompt: str, feedback_key: str):
+    """Return the LLM-as-judge for ``prompt``, created once per process."""
+    from openevals.llm import create_llm_as_judge
+
+    return create_llm_as_judge(
+        prompt=prompt,
+        judge=_get_judge_model(JUDGE_MODEL),
+        feedback_key=feedback_key,
+    )
+
 
 # Specific source-finding correctness prompt
 SOURCE_CORRECTNESS_PROMPT = """
@@ -33,6 +175,7 @@ COMMENT: [Brief explanation of whether the exact source was found or not]
 """  # noqa: E501
 
 
+@cached_judge(prompt=SOURCE_CORRECTNESS_PROMPT, feedback_key="correctness")
 @traceable(
     run_type="llm",
     metadata={"ls_provider": "anthropic", "ls_model_name": "claude-sonnet-4-20250514"}
@@ -43,17 +186,21 @@ def correctness_evaluator(inputs: dict, outputs: dict, reference_outputs: dict):
     Evaluator checks if the target function's output contains the exact
     source reference from the expected answer - a simple yes/no evaluation.
     """
-    evaluator = create_llm_as_judge(
-        prompt=SOURCE_CORRECTNESS_PROMPT,
-        model="anthropic:claude-sonnet-4-20250514",
-        feedback_key="correctness",
-    )
-    eval_result = evaluator(
+    eval_result = _get_judge(SOURCE_CORRECTNESS_PROMPT, "correctness")(
         inputs=inputs, outputs=outputs, reference_outputs=reference_outputs
     )
     return eval_result
 
 
+@functools.cache
+def _rag_helpfulness_prompt() -> str:
+    """Return openevals' RAG helpfulness prompt, imported on first use."""
+    from openevals.prompts import RAG_HELPFULNESS_PROMPT
+
+    return RAG_HELPFULNESS_PROMPT
+
+
+@cached_judge(prompt=_rag_helpfulness_prompt, feedback_key="helpfulness")
 @traceable(
     run_type="llm",
     metadata={"ls_provider": "anthropic", "ls_model_name": "claude-sonnet-4-20250514"}
@@ -64,12 +211,7 @@ def helpfulness_evaluator(inputs: dict, outputs: dict, reference_outputs: dict):
     Evaluator that checks how well the output addresses the input question.
     Does not require reference outputs.
     """
-    evaluator = create_llm_as_judge(
-        prompt=RAG_HELPFULNESS_PROMPT,
-        model="anthropic:claude-sonnet-4-20250514",
-        feedback_key="helpfulness",
-    )
-    eval_result = evaluator(
+    eval_result = _get_judge(_rag_helpfulness_prompt(), "helpfulness")(
         inputs=inputs,
         outputs=outputs,
     )
@@ -100,6 +242,7 @@ COMMENT: [Your explanation here]
 """
 
 
+@cached_judge(prompt=TORAH_CITATION_PROMPT, feedback_key="torah_citations")
 @traceable(
     run_type="llm",
     metadata={"ls_provider": "anthropic", "ls_model_name": "claude-sonnet-4-20250514"}
@@ -110,12 +253,7 @@ def torah_citation_evaluator(inputs: dict, outputs: dict, reference_outputs: dic
     Custom evaluator that checks if Torah responses include proper citations
     and follow scholarly conventions.
     """
-    evaluator = create_llm_as_judge(
-        prompt=TORAH_CITATION_PROMPT,
-        model="anthropic:claude-sonnet-4-20250514",
-        feedback_key="torah_citations",
-    )
-    eval_result = evaluator(
+    eval_result = _get_judge(TORAH_CITATION_PROMPT, "torah_citations")(
         inputs=inputs,
         outputs=outputs,
     )
@@ -146,6 +284,7 @@ COMMENT: [Your explanation here]
 """
 
 
+@cached_judge(prompt=HEBREW_HANDLING_PROMPT, feedback_key="hebrew_handling")
 @traceable(
     run_type="llm",
     metadata={"ls_provider": "anthropic", "ls_model_name": "claude-sonnet-4-20250514"}
@@ -156,12 +295,7 @@ def hebrew_handling_evaluator(inputs: dict, outputs: dict, reference_outputs: di
     Custom evaluator that checks if responses properly handle Hebrew text
     and Jewish religious concepts.
     """
-    evaluator = create_llm_as_judge(
-        prompt=HEBREW_HANDLING_PROMPT,
-        model="anthropic:claude-sonnet-4-20250514",
-        feedback_key="hebrew_handling",
-    )
-    eval_result = evaluator(
+    eval_result = _get_judge(HEBREW_HANDLING_PROMPT, "hebrew_handling")(
         inputs=inputs,
         outputs=outputs,
     )
@@ -191,6 +325,7 @@ COMMENT: [Your explanation here]
 """
 
 
+@cached_judge(prompt=DEPTH_ANALYSIS_PROMPT, feedback_key="depth_analysis")
 @traceable(
     run_type="llm",
     metadata={"ls_provider": "anthropic", "ls_model_name": "claude-sonnet-4-20250514"}
@@ -200,18 +335,140 @@ def depth_analysis_evaluator(inputs: dict, outputs: dict, reference_outputs: dic
 
     Custom evaluator that checks the depth and sophistication of Torah analysis.
     """
-    evaluator = create_llm_as_judge(
-        prompt=DEPTH_ANALYSIS_PROMPT,
-        model="anthropic:claude-sonnet-4-20250514",
-        feedback_key="depth_analysis",
-    )
-    eval_result = evaluator(
+    eval_result = _get_judge(DEPTH_ANALYSIS_PROMPT, "depth_analysis")(
         inputs=inputs,
         outputs=outputs,
     )
     return eval_result
 
 
+# Combined rubric evaluator: grades all criteria in a single judge call so the
+# question and answer are sent once instead of once per evaluator
+COMBINED_RUBRIC_PROMPT = """
+You are evaluating a response to a Torah scholarship question against several
+independent criteria.
+
+QUESTION:
+{inputs}
+
+RESPONSE:
+{outputs}
+
+EXPECTED SOURCE (from reference answer):
+{reference_outputs}
+
+Evaluate the response on each of the following criteria separately. For each one,
+give a brief explanation and a score of true/false.
+
+correctness:
+Does the response contain the exact source that appears in the expected answer?
+Look for the specific book name, section, and reference details that match the
+expected source, and at whether the content of the response comes from it.
+- true: The response contains the exact source from the expected answer, even if
+  additional context is present, some text is missing, or the format is slightly
+  different
+- false: The response does not contain the exact source, or contains a
+  different/incorrect source
+LOOK VERY CAREFULLY at the reference source and the actual response, some times the
+citing is little different due to a different splitting or different editions, and
+you will have to make the decision if it is the same source.
+
+helpfulness:
+Does the response directly address the core question, provide accurate and
+necessary information, and stay appropriately detailed for the query's scope?
+An unhelpful response fails to address the main question or contains primarily
+unrelated information. Correct information may differ from your built-in knowledge.
+
+torah_citations:
+1. Does it cite specific sources when making claims?
+2. Does it use proper Hebrew/Aramaic terminology?
+3. Does it demonstrate knowledge of Torah scholarship conventions?
+4. Are the citations accurate and properly formatted?
+
+hebrew_handling:
+1. Does it correctly interpret Hebrew/Aramaic text when present?
+2. Does it show understanding of Jewish religious concepts?
+3. Does it handle transliteration appropriately?
+4. Does it respect the religious context of the material?
+
+depth_analysis:
+1. Does it provide deep, nuanced analysis rather than surface-level answers?
+2. Does it consider multiple perspectives or interpretations?
+3. Does it demonstrate knowledge of commentaries and secondary sources?
+4. Does it show awareness of the broader context and implications?
+"""
+
+COMBINED_RUBRIC_KEYS = (
+    "correctness",
+    "helpfulness",
+    "torah_citations",
+    "hebrew_handling",
+    "depth_analysis",
+)
+
+_CRITERION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "reasoning": {
+            "type": "string",
+            "description": "A brief explanation of the score for this criterion.",
+        },
+        "score": {
+            "type": "boolean",
+            "description": "Whether the response meets this criterion.",
+        },
+    },
+    "required": ["reasoning", "score"],
+}
+
+_COMBINED_RUBRIC_SCHEMA = {
+    "title": "torah_rubric",
+    "description": "Scores and explanations for each evaluation criterion.",
+    "type": "object",
+    "properties": {key: _CRITERION_SCHEMA for key in COMBINED_RUBRIC_KEYS},
+    "required": list(COMBINED_RUBRIC_KEYS),
+}
+
+
+@functools.cache
+def _get_combined_rubric_judge():
+    """Return the combined rubric judge, created on first use."""
+    from openevals.llm import create_llm_as_judge
+
+    return create_llm_as_judge(
+        prompt=COMBINED_RUBRIC_PROMPT,
+        judge=_get_judge_model(JUDGE_MODEL),
+        output_schema=_COMBINED_RUBRIC_SCHEMA,
+    )
+
+
+@cached_judge(prompt=COMBINED_RUBRIC_PROMPT, feedback_key="combined_rubric")
+@traceable(
+    run_type="llm",
+    metadata={"ls_provider": "anthropic", "ls_model_name": "claude-sonnet-4-20250514"}
+)
+def combined_evaluator(inputs: dict, outputs: dict, reference_outputs: dict):
+    """Return results for every criterion from a single judge call.
+
+    Grades correctness, helpfulness, citations, Hebrew handling and depth of
+    analysis in one combined rubric and fans the verdict out into one
+    feedback entry per criterion. The combined rubric is worded differently
+    from the individual judges, so its feedback keys are prefixed with
+    "combined_" to keep experiments graded either way distinguishable.
+    """
+    verdict = _get_combined_rubric_judge()(
+        inputs=inputs, outputs=outputs, reference_outputs=reference_outputs
+    )
+    return [
+        {
+            "key": f"combined_{key}",
+            "score": verdict[key]["score"],
+            "comment": verdict[key]["reasoning"],
+        }
+        for key in COMBINED_RUBRIC_KEYS
+    ]
+
+
 # Registry of available evaluators
 EVALUATOR_FUNCTIONS = {
     "correctness": correctness_evaluator,
@@ -221,30 +478,86 @@ EVALUATOR_FUNCTIONS = {
     "depth_analysis": depth_analysis_evaluator,
 }
 
+# Name selecting the combined rubric judge, which grades every criterion in
+# one judge call
+COMBINED_EVALUATOR_NAME = "combined"
+
+# Precomputed views of the registry, so lookups allocate nothing per call
+_SELECTABLE_EVALUATORS = {
+    **EVALUATOR_FUNCTIONS,
+    COMBINED_EVALUATOR_NAME: combined_evaluator,
+}
+_ALL_NAMES = tuple(_SELECTABLE_EVALUATORS)
+_NAME_SET = frozenset(_SELECTABLE_EVALUATORS)
+_ALL_EVALUATORS = (combined_evaluator,)
+
+
+@functools.cache
+def _combine_evaluators(names: tuple):
+    """Combine several evaluators into one that runs them concurrently.
+
+    Each judge is an independent LLM round-trip, so fanning them out over a
+    thread pool makes per-example latency the slowest judge instead of the
+    sum of all of them. LangSmith accepts the returned list of results as
+    feedback from a single evaluator. A failing judge is reported as an
+    error entry under its name without discarding the other verdicts.
+    """
+    evaluators = tuple(_SELECTABLE_EVALUATORS[name] for name in names)
+
+    def parallel_evaluator(inputs: dict, outputs: dict, reference_outputs: dict):
+        with ContextThreadPoolExecutor(max_workers=len(evaluators)) as executor:
+            futures = [
+                executor.submit(
+                    evaluator,
+                    inputs=inputs,
+                    outputs=outputs,
+                    reference_outputs=reference_outputs,
+                )
+                for evaluator in evaluators
+            ]
+
+            results = []
+            for name, future in zip(names, futures, strict=True):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {"key": name, "score": None, "comment": f"Error: {e}"}
+                if isinstance(result, list):
+                    results.extend(result)
+                else:
+                    results.append(result)
+            return results
+
+    return parallel_evaluator
+
 
 def get_evaluators(names=None):
     """Get evaluator functions by names.
 
+    With no names, or the name "combined", all criteria are graded together
+    by the combined rubric judge in a single call, reported under combined_*
+    feedback keys; several named evaluators are returned as one evaluator
+    that runs their judges concurrently.
+
     Args:
-        names: List of evaluator names, or None for all evaluators
+        names: List of evaluator names, or None for the combined rubric judge
 
     Returns:
-        List of evaluator functions
+        Tuple of evaluator functions
 
     """
     if names is None:
-        return list(EVALUATOR_FUNCTIONS.values())
-
-    evaluators = []
-    for name in names:
-        if name not in EVALUATOR_FUNCTIONS:
-            available = ", ".join(EVALUATOR_FUNCTIONS.keys())
-            raise ValueError(f"Evaluator '{name}' not found. Available: {available}")
-        evaluators.append(EVALUATOR_FUNCTIONS[name])
+        return _ALL_EVALUATORS
 
-    return evaluators
+    missing = [name for name in names if name not in _NAME_SET]
+    if missing:
+        available = ", ".join(_ALL_NAMES)
+        raise ValueError(f"Evaluator '{missing[0]}' not found. Available: {available}")
+    if len(names) > 1:
+        return (_combine_evaluators(tuple(names)),)
+    return tuple(_SELECTABLE_EVALUATORS[name] for name in names)
 
 
 def list_evaluators():
     """List all available evaluator names."""
-    return list(EVALUATOR_FUNCTIONS.keys())
+    return _ALL_NAMES
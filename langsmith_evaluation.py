@@ -1,69 +1,155 @@
 """Main entrypoint for langsmith evaluation."""
 
-import json
+import asyncio
+import inspect
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
+import orjson
 from dotenv import load_dotenv
 from langsmith import Client
+from langsmith.utils import LangSmithNotFoundError
 
-from evaluators import get_evaluators, list_evaluators
-from targets import get_target_function, list_target_functions
+from evaluators import JUDGE_CACHE_STATS, get_evaluators, list_evaluators
+from targets import (
+    get_target_function,
+    is_batch_target,
+    is_local_server_target,
+    list_target_functions,
+)
 
 MIN_ARGUMENTS_FOR_EVAL = 2
-# Load environment variables from .env file
-load_dotenv()
+# Number of examples evaluated concurrently; targets and judges are I/O bound,
+# so this is bounded by API rate limits rather than local resources. Targets
+# served by a single local server get one example at a time, since each
+# question can run a long analysis there. Set MAX_CONCURRENCY to override.
+MAX_CONCURRENCY = 16
+LOCAL_SERVER_MAX_CONCURRENCY = 1
+DATASET_PATH = Path("dataset/Q1-dataset.json")
+DATASET_NAME = "Torah Evaluation Dataset Type 1 - Updated"
+CREATE_DATASET_FLAG = "--create-dataset"
+# Examples are uploaded in chunks of this size, several chunks at a time
+UPLOAD_CHUNK_SIZE = 100
+UPLOAD_MAX_WORKERS = 8
 
-# Initialize LangSmith client
-client = Client()
 
-# Load existing dataset
-with open("dataset/Q1-dataset.json", encoding="utf-8") as f:
-    dataset_examples = json.load(f)
+def load_dataset_examples(path=DATASET_PATH):
+    """Load the dataset examples from JSON."""
+    return orjson.loads(path.read_bytes())
+
+
+def precompute_batch_target(batch_function, examples):
+    """Run a batch target over all examples up front.
+
+    Returns a per-example target function that looks up the precomputed
+    answer for each question, for use with client.evaluate.
+    """
+    batch_outputs = batch_function([example.inputs for example in examples])
+    answers = {
+        example.inputs["question"]: batch_outputs[str(i)]
+        for i, example in enumerate(examples)
+    }
+
+    def batch_target(inputs: dict) -> dict:
+        return answers[inputs["question"]]
+
+    return batch_target
+
+
+def create_dataset(client):
+    """Create the evaluation dataset in LangSmith from the local JSON file.
+
+    An existing dataset with the same name is reused as is.
+    """
+    try:
+        dataset = client.read_dataset(dataset_name=DATASET_NAME)
+    except LangSmithNotFoundError:
+        pass
+    else:
+        print(f"Dataset already exists with ID: {dataset.id}")
+        return dataset
+
+    # Read the examples first so a broken dataset file fails before anything
+    # is created
+    examples = load_dataset_examples()
+    chunks = [
+        examples[i : i + UPLOAD_CHUNK_SIZE]
+        for i in range(0, len(examples), UPLOAD_CHUNK_SIZE)
+    ]
 
-# Create or get dataset in LangSmith
-dataset_name = "Torah Evaluation Dataset Type 1 - Updated"
-try:
     dataset = client.create_dataset(
-        dataset_name=dataset_name,
+        dataset_name=DATASET_NAME,
         description=(
-            "A dataset for evaluating Torah-related Q&A responses",
-            " (Type 1 queries only).",
+            "A dataset for evaluating Torah-related Q&A responses"
+            " (Type 1 queries only)."
         ),
     )
     # Add examples to the dataset
-    client.create_examples(dataset_id=dataset.id, examples=dataset_examples)
+    with ThreadPoolExecutor(max_workers=UPLOAD_MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(client.create_examples, dataset_id=dataset.id, examples=c)
+            for c in chunks
+        ]
+        try:
+            for i, future in enumerate(futures, start=1):
+                future.result()
+                print(f"Uploaded example chunk {i}/{len(chunks)}")
+        except BaseException:
+            # Later runs reuse an existing dataset as is, so never leave a
+            # partially uploaded one behind
+            executor.shutdown(cancel_futures=True)
+            client.delete_dataset(dataset_id=dataset.id)
+            raise
     print(f"Created new dataset with ID: {dataset.id}")
-except Exception as e:
-    print(f"Dataset might already exist: {e}")
-    # If dataset exists, try to find it
-    datasets = client.list_datasets()
-    dataset = next((d for d in datasets if d.name == dataset_name), None)
-    if not dataset:
-        raise Exception("Could not create or find dataset")
+    return dataset
 
-# Evaluators are now imported from evaluators.py
 
-# Run the evaluation
-if __name__ == "__main__":
+def get_max_concurrency(target_name):
+    """Return how many examples to evaluate at once for the named target."""
+    if value := os.getenv("MAX_CONCURRENCY"):
+        return int(value)
+    if is_local_server_target(target_name):
+        return LOCAL_SERVER_MAX_CONCURRENCY
+    return MAX_CONCURRENCY
+
+
+def report_judge_cache():
+    """Print how many judge verdicts were reused from the cache."""
+    lookups, misses = JUDGE_CACHE_STATS["lookups"], JUDGE_CACHE_STATS["misses"]
+    if lookups:
+        print(
+            f"Judge cache: {lookups - misses} verdicts reused, "
+            f"{misses} judge calls made"
+        )
+
+
+def main():
+    """Run the evaluation from the command line."""
     # Parse command line arguments
+    args = [arg for arg in sys.argv[1:] if arg != CREATE_DATASET_FLAG]
     target_name = "anthropic_sonnet"
     evaluator_names = ["correctness"]  # Only use correctness evaluator
 
     # Handle command line arguments
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "list":
+    if args:
+        if args[0] == "list":
             print("Available target functions:")
             for name in list_target_functions():
                 print(f"  - {name}")
             print("\nAvailable evaluators:")
             for name in list_evaluators():
                 print(f"  - {name}")
-            sys.exit(0)
+            return
         else:
-            target_name = sys.argv[1]
+            target_name = args[0]
             # Optional: specify evaluators as second argument (comma-separated)
-            if len(sys.argv) > MIN_ARGUMENTS_FOR_EVAL:
-                evaluator_names = sys.argv[2].split(",")
+            if len(args) >= MIN_ARGUMENTS_FOR_EVAL:
+                evaluator_names = args[1].split(",")
+
+    # Load environment variables from .env file
+    load_dotenv()
 
     try:
         target_function = get_target_function(target_name)
@@ -81,14 +167,38 @@ if __name__ == "__main__":
         print("Use 'python langsmith_evaluation.py list' to see available evaluators")
         sys.exit(1)
 
+    # Initialize LangSmith client
+    client = Client()
+
+    # The dataset only needs to be uploaded once
+    if CREATE_DATASET_FLAG in sys.argv:
+        create_dataset(client)
+
+    if is_batch_target(target_name):
+        examples = list(client.list_examples(dataset_name=DATASET_NAME))
+        print(f"Submitting {len(examples)} examples as a single batch...")
+        target_function = precompute_batch_target(target_function, examples)
+
     print("Starting evaluation...")
 
-    experiment_results = client.evaluate(
-        target_function,
-        data=dataset_name,
-        evaluators=evaluators,
-        experiment_prefix=f"torah-eval-{target_name}",
-    )
+    evaluate_kwargs = {
+        "data": DATASET_NAME,
+        "evaluators": evaluators,
+        "experiment_prefix": f"torah-eval-{target_name}",
+        "max_concurrency": get_max_concurrency(target_name),
+    }
+    if inspect.iscoroutinefunction(target_function):
+        # Async targets run concurrently on a single event loop
+        experiment_results = asyncio.run(
+            client.aevaluate(target_function, **evaluate_kwargs)
+        )
+    else:
+        experiment_results = client.evaluate(target_function, **evaluate_kwargs)
 
     print(f"Evaluation complete! Results: {experiment_results}")
+    report_judge_cache()
     print("Check the LangSmith UI for detailed results.")
+
+
+if __name__ == "__main__":
+    main()
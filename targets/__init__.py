@@ -4,37 +4,82 @@ Each target function represents a different system or approach to evaluate.
 All functions should take inputs dict and return outputs dict.
 """
 
-from .anthropic_targets import anthropic_torah_qa, anthropic_torah_qa_haiku
-from .ituria_js_api_target import ituria_js_api_target
-from .simple_target import simple_template_response
+import importlib
 
-# Registry of available target functions
+# Registry of available target functions, as (module, function name) pairs so
+# that a target's SDKs are only imported once that target is selected
 TARGET_FUNCTIONS = {
-    "anthropic_sonnet": anthropic_torah_qa,
-    "anthropic_haiku": anthropic_torah_qa_haiku,
-    "simple_template": simple_template_response,
-    "ituria_js_api": ituria_js_api_target,
+    "anthropic_sonnet": (".anthropic_targets", "anthropic_torah_qa"),
+    "anthropic_haiku": (".anthropic_targets", "anthropic_torah_qa_haiku"),
+    "simple_template": (".simple_target", "simple_template_response"),
+    "ituria_js_api": (".ituria_js_api_target", "ituria_js_api_target"),
+    "ituria_js_api_async": (".ituria_js_api_target", "ituria_js_api_target_async"),
+    "anthropic_sonnet_batch": (".anthropic_targets", "anthropic_torah_qa_batch"),
 }
 
+# Targets that take the whole list of dataset inputs at once instead of a
+# single inputs dict
+BATCH_TARGET_FUNCTIONS = {"anthropic_sonnet_batch"}
+
+# Targets served by a single local server, which should not be sent many
+# long-running questions at once
+LOCAL_SERVER_TARGET_FUNCTIONS = {"ituria_js_api", "ituria_js_api_async"}
+
+
+def _load(module_name: str, function_name: str):
+    module = importlib.import_module(module_name, __name__)
+    # Cache every registered function of the module on the package. This also
+    # replaces the submodule attribute that importing sets when a module and
+    # one of its target functions share a name, whichever function was asked
+    # for first.
+    for registered_module, registered_function in TARGET_FUNCTIONS.values():
+        if registered_module == module_name:
+            globals()[registered_function] = getattr(module, registered_function)
+    return globals()[function_name]
+
 
 def get_target_function(name: str):
     """Get a target function by name."""
     if name not in TARGET_FUNCTIONS:
         available = ", ".join(TARGET_FUNCTIONS.keys())
         raise ValueError(f"Target function '{name}' not found. Available: {available}")
-    return TARGET_FUNCTIONS[name]
+    return _load(*TARGET_FUNCTIONS[name])
+
+
+def is_batch_target(name: str) -> bool:
+    """Return whether the named target processes the whole dataset at once."""
+    return name in BATCH_TARGET_FUNCTIONS
+
+
+def is_local_server_target(name: str) -> bool:
+    """Return whether the named target is served by a single local server."""
+    return name in LOCAL_SERVER_TARGET_FUNCTIONS
 
 
 def list_target_functions():
     """List all available target functions."""
     return list(TARGET_FUNCTIONS.keys())
 
+
+def __getattr__(name: str):
+    """Import target functions on first attribute access."""
+    for module_name, function_name in TARGET_FUNCTIONS.values():
+        if function_name == name:
+            return _load(module_name, function_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     'anthropic_torah_qa',
     'anthropic_torah_qa_haiku',
+    'anthropic_torah_qa_batch',
     'simple_template_response',
     'ituria_js_api_target',
+    'ituria_js_api_target_async',
     'TARGET_FUNCTIONS',
+    'BATCH_TARGET_FUNCTIONS',
+    'LOCAL_SERVER_TARGET_FUNCTIONS',
     'get_target_function',
+    'is_batch_target',
+    'is_local_server_target',
     'list_target_functions'
 ]
@@ -0,0 +1,127 @@
+"""Repeated-question answer cache for expensive target functions."""
+
+import asyncio
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+# Opt-in, since a cached answer is not a fresh measurement of the target;
+# set TARGET_CACHE=1 to enable
+TARGET_CACHE_DIR = Path(os.getenv("TARGET_CACHE_DIR", ".cache"))
+
+
+def _normalize(question: str) -> str:
+    return " ".join(question.split()).casefold()
+
+
+def _is_error(result: dict) -> bool:
+    answer = result.get("answer")
+    return not isinstance(answer, str) or answer.startswith(("Error:", "API Error"))
+
+
+class AnswerCache:
+    """Answers keyed by normalized question text.
+
+    Questions only hit when they are identical after collapsing whitespace
+    and case. Fuzzy matching is deliberately avoided: questions that differ
+    only in a source reference (Genesis 1:1 vs 1:2) are near-identical as
+    strings but need different answers. Entries older than ttl_days are
+    ignored and dropped on the next write. The cache is stored as one JSON
+    file.
+    """
+
+    def __init__(self, path: Path, ttl_days: float = 7):
+        self.path = path
+        self.ttl = ttl_days * 24 * 60 * 60
+        self._entries: dict[str, dict] | None = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, dict]:
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self.path.read_text(encoding="utf-8"))
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._entries = {}
+        return self._entries
+
+    def get(self, question: str) -> dict | None:
+        with self._lock:
+            entry = self._load().get(_normalize(question))
+        if entry is None or entry["t"] < time.time() - self.ttl:
+            return None
+        return dict(entry["result"])
+
+    def put(self, question: str, result: dict) -> None:
+        now = time.time()
+        with self._lock:
+            entries = self._load()
+            entries[_normalize(question)] = {"t": now, "result": result}
+            self._entries = {
+                key: entry
+                for key, entry in entries.items()
+                if entry["t"] >= now - self.ttl
+            }
+
+            # Write to a temporary file first so a crash never leaves a
+            # truncated cache behind; the name is unique per process and
+            # thread so concurrent writers never share one
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(
+                f".{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            tmp_path.write_text(
+                json.dumps(self._entries, ensure_ascii=False), encoding="utf-8"
+            )
+            os.replace(tmp_path, self.path)
+
+
+def cached_answers(ttl_days: float = 7):
+    """Serve a target's answers for repeated questions from a cache.
+
+    Works with both sync and async targets. Error answers are not cached.
+    Each target gets its own cache file under TARGET_CACHE_DIR. Apply it
+    beneath @traceable so that cache hits are traced as well.
+    """
+
+    def decorator(func):
+        cache = AnswerCache(TARGET_CACHE_DIR / f"{func.__name__}.json", ttl_days)
+
+        def enabled() -> bool:
+            return os.getenv("TARGET_CACHE", "0") == "1"
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(inputs: dict) -> dict:
+                if not enabled():
+                    return await func(inputs)
+                if (result := cache.get(inputs["question"])) is not None:
+                    return result
+                result = await func(inputs)
+                if not _is_error(result):
+                    # Rewriting the cache file blocks, so keep it off the loop
+                    await asyncio.to_thread(cache.put, inputs["question"], result)
+                return result
+
+            async_wrapper.cache = cache
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(inputs: dict) -> dict:
+            if not enabled():
+                return func(inputs)
+            if (result := cache.get(inputs["question"])) is not None:
+                return result
+            result = func(inputs)
+            if not _is_error(result):
+                cache.put(inputs["question"], result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
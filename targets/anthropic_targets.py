@@ -1,6 +1,10 @@
 """Anthropic-based Torah Q&A targets."""
 
+import time
+
 from anthropic import Anthropic
+from anthropic.types.message_create_params import MessageCreateParamsNonStreaming
+from anthropic.types.messages.batch_create_params import Request
 from dotenv import load_dotenv
 from langsmith import wrappers
 
@@ -11,12 +15,36 @@ when possible.
 If asked about Divrei Yoel or other Hasidic texts, try to provide relevant teachings
 and sources.
 """
+
+# System prompt as a cacheable content block, so repeated requests can reuse
+# the cached prefix instead of re-processing it. Anthropic only caches prefixes
+# above a minimum length, so this takes effect once the prompt is long enough.
+_SYSTEM_BLOCK = [
+    {"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}
+]
+
+# Request parameters shared by every target, built once
+_BASE_KW = {"max_tokens": 1000, "system": _SYSTEM_BLOCK}
+
 # Load environment variables
 load_dotenv()
 
 # Initialize clients
 anthropic_client = wrappers.wrap_anthropic(Anthropic())
 
+# Seconds to wait between polls of a running message batch
+BATCH_POLL_INTERVAL = 30
+
+
+def _extract_answer(message) -> dict:
+    """Build the target output from an Anthropic message."""
+    # Handle different content types
+    content = message.content[0]
+    if hasattr(content, "text"):
+        return {"answer": content.text.strip()}
+    else:
+        return {"answer": str(content).strip()}
+
 
 def anthropic_torah_qa(inputs: dict) -> dict:
     """Torah Q&A system using Anthropic Claude.
@@ -30,17 +58,11 @@ def anthropic_torah_qa(inputs: dict) -> dict:
     """
     response = anthropic_client.messages.create(
         model="claude-3-5-sonnet-20241022",
-        max_tokens=1000,
-        system=SYSTEM_PROMPT,
+        **_BASE_KW,
         messages=[{"role": "user", "content": inputs["question"]}],
     )
 
-    # Handle different content types
-    content = response.content[0]
-    if hasattr(content, "text"):
-        return {"answer": content.text.strip()}
-    else:
-        return {"answer": str(content).strip()}
+    return _extract_answer(response)
 
 
 def anthropic_torah_qa_haiku(inputs: dict) -> dict:
@@ -55,14 +77,51 @@ def anthropic_torah_qa_haiku(inputs: dict) -> dict:
     """
     response = anthropic_client.messages.create(
         model="claude-3-haiku-20240307",
-        max_tokens=1000,
-        system=SYSTEM_PROMPT,
+        **_BASE_KW,
         messages=[{"role": "user", "content": inputs["question"]}],
     )
 
-    # Handle different content types
-    content = response.content[0]
-    if hasattr(content, "text"):
-        return {"answer": content.text.strip()}
-    else:
-        return {"answer": str(content).strip()}
+    return _extract_answer(response)
+
+
+def anthropic_torah_qa_batch(dataset: list[dict]) -> dict[str, dict]:
+    """Torah Q&A over a whole dataset using the Message Batches API.
+
+    Submits every question in one batch, which is processed asynchronously
+    at a discount, waits for the batch to end and collects the answers.
+
+    Args:
+        dataset: List of inputs dicts, each with a 'question' key
+
+    Returns:
+        Dict mapping each input's index (as a string) to a dict with an
+        'answer' key
+
+    """
+    batch = anthropic_client.messages.batches.create(
+        requests=[
+            Request(
+                custom_id=str(i),
+                params=MessageCreateParamsNonStreaming(
+                    model="claude-3-5-sonnet-20241022",
+                    **_BASE_KW,
+                    messages=[{"role": "user", "content": inputs["question"]}],
+                ),
+            )
+            for i, inputs in enumerate(dataset)
+        ]
+    )
+
+    while batch.processing_status != "ended":
+        time.sleep(BATCH_POLL_INTERVAL)
+        batch = anthropic_client.messages.batches.retrieve(batch.id)
+
+    answers = {}
+    for entry in anthropic_client.messages.batches.results(batch.id):
+        if entry.result.type == "succeeded":
+            answers[entry.custom_id] = _extract_answer(entry.result.message)
+        else:
+            answers[entry.custom_id] = {
+                "answer": f"Error: batch request {entry.result.type}"
+            }
+    return answers
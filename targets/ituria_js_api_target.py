@@ -1,12 +1,145 @@
 """Target function that uses the local Ituria JavaScript API server for Torah Q&A."""
 
+import threading
+import time
 from http import HTTPStatus
 
+import httpx
+import orjson
 import requests
 from langsmith.run_helpers import get_current_run_tree, traceable
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ._answer_cache import cached_answers
+
+# Shared session so the connection to the local server is kept alive across
+# questions. Only failed connection attempts are retried: a read timeout or an
+# error response from a long-running analysis is not worth repeating.
+_SESSION = requests.Session()
+_SESSION.headers["Content-Type"] = "application/json"
+_SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, connect=2, read=0, backoff_factor=0.2),
+    ),
+)
+
+# Shared async client for ituria_js_api_target_async, created on first use so
+# that it is bound to the event loop running the evaluation
+_ASYNC_CLIENT: httpx.AsyncClient | None = None
+
+CHAT_URL = "http://localhost:8333/chat"
+
+# Fail fast if the server is unreachable; allow 30 minutes for the response to
+# complex Torah analysis with reasoning
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 1800
+
+CONNECTION_ERROR_ANSWER = (
+    "Error: Could not connect to Ituria JavaScript API server. "
+    "Make sure it's running on localhost:8333 (PORT=8333 npm start)"
+)
+TIMEOUT_ERROR_ANSWER = "Error: API request timed out (exceeded 30 min.)"
+BREAKER_OPEN_ANSWER = "Error: upstream unavailable (breaker open)"
+
+
+class _CircuitBreaker:
+    """Fail fast while the server is down.
+
+    After fail_max consecutive connection failures or timeouts the breaker
+    opens and calls are refused for reset_timeout seconds. After that, a
+    single trial call is let through while other callers are still refused;
+    a response closes the breaker, a failure reopens it for another
+    reset_timeout. Callers pass acquire()'s result to release() once an
+    allowed call is done.
+    """
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def acquire(self) -> bool | None:
+        """Return None to refuse a call, otherwise whether it is the trial."""
+        with self._lock:
+            if self._failures < self.fail_max:
+                return False
+            if (
+                self._trial_in_flight
+                or time.monotonic() - self._opened_at < self.reset_timeout
+            ):
+                return None
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
+
+    def release(self, trial: bool) -> None:
+        # A trial that ended without a verdict (e.g. an unexpected error or
+        # cancellation) leaves the breaker open for the next caller to retry
+        if trial:
+            with self._lock:
+                self._trial_in_flight = False
+
+
+# Shared by the sync and async targets, since both talk to the same server
+_BREAKER = _CircuitBreaker(fail_max=5, reset_timeout=30)
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    global _ASYNC_CLIENT
+    if _ASYNC_CLIENT is None:
+        _ASYNC_CLIENT = httpx.AsyncClient(
+            headers={"Content-Type": "application/json"},
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+        )
+    return _ASYNC_CLIENT
+
+
+def _tracing_headers() -> dict | None:
+    """Return LangSmith headers for distributed tracing, if inside a run."""
+    if run_tree := get_current_run_tree():
+        return run_tree.to_headers()
+    return None
+
+
+def _result_from_response(response) -> dict:
+    """Build the target output from a requests or httpx response."""
+    if response.status_code == HTTPStatus.OK:
+        data = orjson.loads(response.content)
+        result = {"answer": data["answer"]}
+
+        # Extract usage metadata if available from ituria-js response
+        if "usage_metadata" in data:
+            result["usage_metadata"] = data["usage_metadata"]
+        elif "reasoning_details" in data and data.get("reasoning_details"):
+            # Extract from reasoning details if available
+            reasoning_details = data["reasoning_details"]
+            if isinstance(reasoning_details, dict) and "usage" in reasoning_details:
+                result["usage_metadata"] = reasoning_details["usage"]
+
+        return result
+    else:
+        return {"answer": f"API Error {response.status_code}: {response.text}"}
 
 
 @traceable(name="ituria_js_api_target")
+@cached_answers(ttl_days=7)
 def ituria_js_api_target(inputs: dict) -> dict:
     """Torah Q&A system that uses the local JavaScript Ituria API server.
 
@@ -23,47 +156,68 @@ def ituria_js_api_target(inputs: dict) -> dict:
 
     """
     question = inputs["question"]
+    if (trial := _BREAKER.acquire()) is None:
+        return {"answer": BREAKER_OPEN_ANSWER}
 
     try:
-        # Get current run tree for distributed tracing
-        headers = {"Content-Type": "application/json"}
-        if run_tree := get_current_run_tree():
-            # Add LangSmith tracing headers for distributed tracing
-            headers.update(run_tree.to_headers())
-
-        # Send request to local JavaScript API server
-        response = requests.post(
-            "http://localhost:8333/chat",
+        # Send request to local JavaScript API server; the session already
+        # sets the content type
+        response = _SESSION.post(
+            CHAT_URL,
             json={"question": question},
-            headers=headers,
-            timeout=1800,  # 30 minute timeout for complex Torah analysis with reasoning
+            headers=_tracing_headers(),
+            timeout=(CONNECT_TIMEOUT, READ_TIMEOUT),
         )
-
-        if response.status_code == HTTPStatus.OK:
-            data = response.json()
-            result = {"answer": data["answer"]}
-            
-            # Extract usage metadata if available from ituria-js response
-            if "usage_metadata" in data:
-                result["usage_metadata"] = data["usage_metadata"]
-            elif "reasoning_details" in data and data.get("reasoning_details"):
-                # Extract from reasoning details if available
-                reasoning_details = data["reasoning_details"]
-                if isinstance(reasoning_details, dict) and "usage" in reasoning_details:
-                    result["usage_metadata"] = reasoning_details["usage"]
-            
-            return result
-        else:
-            return {"answer": f"API Error {response.status_code}: {response.text}"}
+        _BREAKER.record_success()
+        return _result_from_response(response)
 
     except requests.exceptions.ConnectionError:
-        return {
-            "answer": (
-                "Error: Could not connect to Ituria JavaScript API server. ",
-                "Make sure it's running on localhost:8333 (PORT=8333 npm start)",
-            )
-        }
+        _BREAKER.record_failure()
+        return {"answer": CONNECTION_ERROR_ANSWER}
     except requests.exceptions.Timeout:
-        return {"answer": "Error: API request timed out (exceeded 30 min.)"}
+        _BREAKER.record_failure()
+        return {"answer": TIMEOUT_ERROR_ANSWER}
+    except Exception as e:
+        return {"answer": f"Error: {str(e)}"}
+    finally:
+        _BREAKER.release(trial)
+
+
+@traceable(name="ituria_js_api_target_async")
+@cached_answers(ttl_days=7)
+async def ituria_js_api_target_async(inputs: dict) -> dict:
+    """Async variant of ituria_js_api_target for concurrent evaluation.
+
+    Shares one keep-alive httpx.AsyncClient across questions, so many
+    questions can be in flight against the server from a single event loop.
+
+    Args:
+        inputs: Dict with 'question' key
+
+    Returns:
+        Dict with 'answer' key
+
+    """
+    question = inputs["question"]
+    if (trial := _BREAKER.acquire()) is None:
+        return {"answer": BREAKER_OPEN_ANSWER}
+
+    try:
+        response = await _get_async_client().post(
+            CHAT_URL,
+            json={"question": question},
+            headers=_tracing_headers(),
+        )
+        _BREAKER.record_success()
+        return _result_from_response(response)
+
+    except (httpx.ConnectError, httpx.ConnectTimeout):
+        _BREAKER.record_failure()
+        return {"answer": CONNECTION_ERROR_ANSWER}
+    except httpx.TimeoutException:
+        _BREAKER.record_failure()
+        return {"answer": TIMEOUT_ERROR_ANSWER}
     except Exception as e:
         return {"answer": f"Error: {str(e)}"}
+    finally:
+        _BREAKER.release(trial)
@@ -1,5 +1,43 @@
 """Simple template-based Torah Q&A target for baseline comparison."""
 
+import functools
+import re
+
+# Keyword patterns in priority order, each mapped to its template answer
+_PATTERNS = [
+    (re.compile(r"divre[iy] yoel"), "divrei_yoel"),
+    (re.compile(r"mos(?:es|he)"), "moses"),
+    (re.compile(r"prayer|tefillah"), "prayer"),
+]
+
+_ANSWERS = {
+    "divrei_yoel": (
+        "This question relates to Divrei Yoel, a collection of Hasidic "
+        "teachings. I would need to consult the specific text to provide an "
+        "accurate answer."
+    ),
+    "moses": (
+        "This question concerns Moses (Moshe Rabbenu), the greatest of "
+        "the prophets and leader of the Jewish people."
+    ),
+    "prayer": (
+        "This relates to Jewish prayer and spiritual practice. Prayer is"
+        " a fundamental aspect of Jewish worship."
+    ),
+    "default": (
+        "This appears to be a Torah-related question that would require "
+        "careful study of the relevant sources to answer properly."
+    ),
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _template_answer(question: str) -> str:
+    for pattern, answer_key in _PATTERNS:
+        if pattern.search(question):
+            return _ANSWERS[answer_key]
+    return _ANSWERS["default"]
+
 
 def simple_template_response(inputs: dict) -> dict:
     """Return simple template-based response for baseline comparison.
@@ -11,34 +49,4 @@ def simple_template_response(inputs: dict) -> dict:
         Dict with 'answer' key
 
     """
-    question = inputs["question"].lower()
-
-    if "divrei yoel" in question or "divrey yoel" in question:
-        return {
-            "answer": (
-                "This question relates to Divrei Yoel, a collection of Hasidic ",
-                "teachings. I would need to consult the specific text to provide an ",
-                "accurate answer.",
-            )
-        }
-    elif "moses" in question or "moshe" in question:
-        return {
-            "answer": (
-                "This question concerns Moses (Moshe Rabbenu), the greatest of ",
-                "the prophets and leader of the Jewish people.",
-            )
-        }
-    elif "prayer" in question or "tefillah" in question:
-        return {
-            "answer": (
-                "This relates to Jewish prayer and spiritual practice. Prayer is",
-                " a fundamental aspect of Jewish worship.",
-            )
-        }
-    else:
-        return {
-            "answer": (
-                "This appears to be a Torah-related question that would require ",
-                "careful study of the relevant sources to answer properly.",
-            )
-        }
+    return {"answer": _template_answer(inputs["question"].lower())}